@@ -12,18 +12,51 @@ Coding strategy:
   include it in the 'tags' column (semicolon-joined).
 
 Required dependencies:
-  pip install requests pandas
+  pip install requests
+
+Optional speedups (pure-Python/regex fallbacks are used without them):
+  pip install pyahocorasick   # single-pass keyword tagging
+  pip install orjson          # faster parsing of Crossref JSON pages
+  pip install pyarrow         # C++ CSV writer for large backfills
+  pip install requests-cache  # on-disk cache of Crossref pages so re-runs skip the network
 """
 
 import os
 import re
+import csv
+import functools
 import html
-import time
+import itertools
+import multiprocessing
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
-from typing import List
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
 import requests
-import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = pacsv = None
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
 
 
 # ----------------------------- Config -----------------------------
@@ -33,6 +66,14 @@ ROWS_PER_PAGE   = 100
 MAX_RETRIES     = 5
 BACKOFF_SECONDS = 3
 HTTP_TIMEOUT    = 20
+FETCH_WORKERS   = 4      # concurrent page requests; stay within Crossref's polite pool
+MAX_OFFSET      = 10000  # Crossref rejects offset paging past this; deeper pulls use cursors
+# SQLite file for cached Crossref pages (needs requests-cache); kept next to this script
+CACHE_PATH      = os.path.join(os.path.dirname(os.path.abspath(__file__)), "crossref_cache.sqlite")
+CACHE_DAYS      = 30     # cached pages expire after this; months older than this are cached for good
+PARALLEL_TAGGING_MIN = 50000  # records tagged in-process before a longer pull switches to a worker pool
+TAG_BLOCK_SIZE  = 5000   # records handed to the worker pool per round trip
+CSV_COLUMNS     = ["publication_date", "title", "abstract", "doi", "url", "last_author", "tags"]
 
 # >>> Define keywords here (examples shown) <<<
 KEYWORDS: List[str] = [
@@ -89,6 +130,10 @@ KEYWORDS: List[str] = [
     "proteomics",
     
 ]
+# Strip blanks and drop case-insensitive duplicates once, keeping the first spelling.
+_seen: Dict[str, str] = {}
+KEYWORDS = [_seen.setdefault(k.lower(), k) for k in map(str.strip, KEYWORDS) if k and k.lower() not in _seen]
+del _seen
 # set to True to only match whole words (e.g., "lipoprotein" but not "lipoproteins").
 WHOLE_WORDS = False
 # ------------------------------------------------------------------
@@ -107,22 +152,20 @@ def previous_month_window(today: date):
     return first_prev_month, last_prev_month, label
 
 
-def iso_date_from_crossref_parts(parts: List[List[int]]) -> str:
-    """Convert Crossref 'date-parts' ([[YYYY,MM,DD]]) to ISO 'YYYY-MM-DD'."""
-    y = parts[0][0]
-    m = parts[0][1] if len(parts[0]) >= 2 else 1
-    d = parts[0][2] if len(parts[0]) >= 3 else 1
-    return f"{y:04d}-{m:02d}-{d:02d}"
-
-
-def extract_pub_date(item: dict) -> str:
-    """Prefer published-online → published-print → issued → created.date-time."""
-    for key in ("published-online", "published-print", "issued"):
-        if key in item and "date-parts" in item[key] and item[key]["date-parts"]:
-            return iso_date_from_crossref_parts(item[key]["date-parts"])
-    if "created" in item and "date-time" in item["created"]:
-        return item["created"]["date-time"][:10]
-    return ""
+def extract_pub_date(item: dict, _keys=("published-online", "published-print", "issued")) -> str:
+    """
+    Prefer published-online → published-print → issued → created.date-time.
+    Crossref 'date-parts' ([[YYYY,MM,DD]]) become ISO 'YYYY-MM-DD', missing month/day → 01.
+    """
+    for key in _keys:
+        d = item.get(key)
+        if d:
+            parts = d.get("date-parts")
+            if parts and parts[0]:
+                dp = parts[0]
+                return f"{dp[0]:04d}-{(dp[1] if len(dp) > 1 else 1):02d}-{(dp[2] if len(dp) > 2 else 1):02d}"
+    created = item.get("created")
+    return created["date-time"][:10] if created and "date-time" in created else ""
 # ------------------------------------------------------------------
 
 
@@ -131,92 +174,308 @@ def clean_abstract(raw: str) -> str:
     """Strip JATS/HTML tags & entities → plain text."""
     if not raw:
         return ""
+    if "<" not in raw:
+        # Plain-text abstract: no markup to strip, and only decode entities if any.
+        return " ".join((html.unescape(raw) if "&" in raw else raw).split())
     txt = re.sub(r"<[^>]+>", " ", raw)
     txt = html.unescape(txt)
-    return re.sub(r"\s+", " ", txt).strip()
+    return " ".join(txt.split())
 
 
 def format_author(auth_obj: dict) -> str:
     """Return 'given family' or fallbacks for Crossref author objects."""
-    given   = auth_obj.get("given", "")
-    family  = auth_obj.get("family", "")
-    literal = auth_obj.get("literal", "")
-    name    = auth_obj.get("name", "")
-    if given or family:
-        return " ".join([given, family]).strip()
+    given  = auth_obj.get("given")
+    family = auth_obj.get("family")
+    # Common case first: nearly every Crossref author has both parts.
+    if given and family:
+        return (given + " " + family).strip()
+    if family or given:
+        return (family or given).strip()
+    name = auth_obj.get("name") or auth_obj.get("literal")
     if name:
         return name.strip()
-    if literal:
-        return literal.strip()
-    parts = [p for p in (auth_obj.get("prefix", ""), given, family, auth_obj.get("suffix", "")) if p]
+    parts = [p for p in (auth_obj.get("prefix", ""), auth_obj.get("suffix", "")) if p]
     return " ".join(parts).strip()
 # ------------------------------------------------------------------
 
 
 # --------------------- keyword logic ----------------------
-def build_keyword_patterns(keywords: List[str], whole_words: bool) -> List[re.Pattern]:
+def _is_word_char(ch: str) -> bool:
+    """True for regex word characters; '' (outside the text) is not one."""
+    return ch.isalnum() or ch == "_"
+
+
+def _keyword_entries(keywords: List[str]) -> Dict[str, Tuple[int, str]]:
+    """Map kw.lower() → (index in keywords, original keyword); keywords are already unique."""
+    return {kw.lower(): (i, kw) for i, kw in enumerate(keywords)}
+
+
+def build_keyword_automaton(keywords: List[str]) -> "ahocorasick.Automaton":
     """
-    Precompile regex patterns for keywords.
-    whole_words=True → wrap with \b boundaries (best for single words).
-    whole_words=False → simple case-insensitive substring pattern.
+    Build an Aho-Corasick automaton over the lowercased keywords so every
+    abstract is scanned once, no matter how many keywords there are.
+    Each entry stores (index in keywords, original keyword).
     """
-    patterns = []
-    for kw in keywords:
-        if not kw:
+    automaton = ahocorasick.Automaton()
+    for key, entry in _keyword_entries(keywords).items():
+        automaton.add_word(key, entry)
+    automaton.make_automaton()
+    return automaton
+
+
+def _contains_keyword(inner: str, outer: str, whole_words: bool) -> bool:
+    """True if keyword `inner` occurs in keyword `outer` (bounded by \\b when whole_words)."""
+    if whole_words:
+        return re.search(rf"\b{re.escape(inner)}\b", outer) is not None
+    return inner in outer
+
+
+def build_keyword_patterns(
+    keywords: List[str], whole_words: bool
+) -> Tuple[re.Pattern, Dict[str, List[Tuple[int, str]]]]:
+    """
+    Fallback when pyahocorasick is missing: one alternation regex over all
+    lowercased keywords (longest first), one named group k<index> per keyword,
+    plus a lookup from each group name to every keyword its match implies,
+    e.g. "crispr interference" → CRISPR too.
+    The alternation sits in a lookahead so finditer tries every start position
+    and overlapping keywords ("long non-coding RNA", "non-coding RNA") all hit.
+    whole_words=True → wrap the alternation with \\b boundaries.
+    """
+    entries = _keyword_entries(keywords)
+    alternation = "|".join(
+        f"(?P<k{entries[k][0]}>{re.escape(k)})" for k in sorted(entries, key=len, reverse=True)
+    )
+    if whole_words:
+        alternation = rf"\b(?:{alternation})\b"
+    pattern = re.compile(rf"(?={alternation})")
+    lookup = {
+        f"k{i}": [entries[k] for k in entries if _contains_keyword(k, key, whole_words)]
+        for key, (i, _) in entries.items()
+    }
+    return pattern, lookup
+
+
+# Abstract → {index in keywords: keyword} for every keyword it contains.
+KeywordMatcher = Callable[[str], Dict[int, str]]
+
+
+def _keyword_regexes(
+    keywords: Tuple[str, ...], whole_words: bool
+) -> Tuple[Tuple[re.Pattern, Tuple[int, str]], ...]:
+    """One case-insensitive regex per keyword (\\b-bounded for whole words), run on the original text."""
+    regexes = []
+    for key, entry in _keyword_entries(keywords).items():
+        escaped = re.escape(key)
+        regexes.append((re.compile(rf"\b{escaped}\b" if whole_words else escaped, re.I), entry))
+    return tuple(regexes)
+
+
+def _match_keywords(abstract: str, scan: Callable[[str], Dict[int, str]],
+                    regexes: Tuple[Tuple[re.Pattern, Tuple[int, str]], ...]) -> Dict[int, str]:
+    text = abstract.lower()
+    if len(text) != len(abstract):
+        # lower() changed the text (e.g. "İ" → "i" + U+0307, not a word character), so
+        # matches and word boundaries in `text` no longer line up with the original;
+        # search the original with per-keyword re.I regexes instead.
+        return {i: kw for pat, (i, kw) in regexes if pat.search(abstract)}
+    return scan(text)
+
+
+def _automaton_hits(text: str, automaton: "ahocorasick.Automaton", whole_words: bool) -> Dict[int, str]:
+    hits = {}
+    for end, (i, kw) in automaton.iter(text):
+        if i in hits:
             continue
-        escaped = re.escape(kw.strip())
         if whole_words:
-            pat = re.compile(rf"\b{escaped}\b", re.I)
-        else:
-            pat = re.compile(escaped, re.I)
-        patterns.append(pat)
-    return patterns
+            start = end - len(kw) + 1
+            if _is_word_char(text[start - 1:start]) == _is_word_char(text[start]):
+                continue
+            if _is_word_char(text[end + 1:end + 2]) == _is_word_char(text[end]):
+                continue
+        hits[i] = kw
+    return hits
+
 
+def _pattern_hits(text: str, pattern: re.Pattern, lookup: Dict[str, List[Tuple[int, str]]]) -> Dict[int, str]:
+    hits = {}
+    for m in pattern.finditer(text):
+        hits.update(lookup[m.lastgroup])
+    return hits
 
-def tags_from_abstract(abstract: str, patterns: List[re.Pattern], keywords: List[str]) -> List[str]:
+
+def _substring_hits(text: str, entries: Tuple[Tuple[str, Tuple[int, str]], ...]) -> Dict[int, str]:
+    return {i: kw for key, (i, kw) in entries if key in text}
+
+
+@functools.lru_cache(maxsize=4)
+def build_keyword_matcher(keywords: Tuple[str, ...], whole_words: bool) -> KeywordMatcher:
+    """
+    Return a KeywordMatcher with whole_words baked in. It scans the lowercased
+    abstract once: with Aho-Corasick when pyahocorasick is available, otherwise
+    with the alternation regex for whole words, or str `in` over the lowercased
+    keywords for substring matching (faster than any regex on literal needles).
+    Abstracts whose length changes under lower() use per-keyword regexes instead.
+    Cached on (keywords, whole_words), so pass keywords as a tuple.
     """
-    Return a deduplicated list of keywords that appear in the abstract.
+    if ahocorasick is not None:
+        automaton = build_keyword_automaton(keywords)
+        scan = functools.partial(_automaton_hits, automaton=automaton, whole_words=whole_words)
+    elif whole_words:
+        pattern, lookup = build_keyword_patterns(keywords, whole_words)
+        scan = functools.partial(_pattern_hits, pattern=pattern, lookup=lookup)
+    else:
+        scan = functools.partial(_substring_hits, entries=tuple(_keyword_entries(keywords).items()))
+    return functools.partial(_match_keywords, scan=scan, regexes=_keyword_regexes(keywords, whole_words))
+
+
+def tags_from_abstract(abstract: str, matcher: KeywordMatcher) -> List[str]:
+    """
+    Return a deduplicated list of keywords that appear in the abstract,
+    in KEYWORDS order. `matcher` comes from build_keyword_matcher.
     """
     if not abstract:
         return []
-    hits = []
-    for kw, pat in zip(keywords, patterns):
-        if pat.search(abstract):
-            hits.append(kw)
-    # Deduplicate while preserving order (case-insensitive key)
-    seen = set()
-    out = []
-    for h in hits:
-        k = h.lower()
-        if k not in seen:
-            seen.add(k)
-            out.append(h)
-    return out
+    hits = matcher(abstract)
+    return [hits[i] for i in sorted(hits)]
+
+
+# Per-process KeywordMatcher; set by _init_tag_worker since matchers are
+# rebuilt in each worker rather than pickled across processes.
+_worker_matcher = None
+
+
+def _init_tag_worker(keywords: Tuple[str, ...], whole_words: bool) -> None:
+    global _worker_matcher
+    _worker_matcher = build_keyword_matcher(keywords, whole_words)
+
+
+def _tag_abstract(abstract: str) -> str:
+    return "; ".join(tags_from_abstract(abstract, _worker_matcher))
+
+
+def tag_records(records: Iterator[dict], keywords: Tuple[str, ...], whole_words: bool) -> Iterator[dict]:
+    """
+    Add a 'tags' field to each record as it streams through, preserving order.
+    The first PARALLEL_TAGGING_MIN records are tagged in-process; only a longer
+    pull (a backfill) on a multi-core machine hands the rest to a
+    multiprocessing.Pool, in TAG_BLOCK_SIZE blocks of abstracts.
+    """
+    records = iter(records)
+    matcher = build_keyword_matcher(keywords, whole_words)
+    serial  = records if (os.cpu_count() or 1) < 2 else itertools.islice(records, PARALLEL_TAGGING_MIN)
+    for rec in serial:
+        rec["tags"] = "; ".join(tags_from_abstract(rec["abstract"], matcher))
+        yield rec
+
+    first = next(records, None)
+    if first is None:
+        return
+    stream = itertools.chain([first], records)
+    with multiprocessing.Pool(initializer=_init_tag_worker, initargs=(keywords, whole_words)) as pool:
+        for block in iter(lambda: list(itertools.islice(stream, TAG_BLOCK_SIZE)), []):
+            tags = pool.map(_tag_abstract, [rec["abstract"] for rec in block], chunksize=64)
+            for rec, rec_tags in zip(block, tags):
+                rec["tags"] = rec_tags
+                yield rec
 # ------------------------------------------------------------------
 
 
 # ------------------------ Crossref retrieval ----------------------
-def fetch_crossref_page(params: dict, headers: dict, rows: int, offset: int) -> dict:
-    """Fetch one page from Crossref with retry/backoff."""
+def make_session() -> requests.Session:
+    """
+    Keep-alive session whose adapter retries 429/5xx with backoff.
+    With requests-cache installed, responses are also cached in CACHE_PATH.
+    """
+    if requests_cache is not None:
+        session = requests_cache.CachedSession(CACHE_PATH, backend="sqlite", expire_after=timedelta(days=CACHE_DAYS))
+    else:
+        session = requests.Session()
+    retry = Retry(
+        total=MAX_RETRIES,
+        backoff_factor=BACKOFF_SECONDS,
+        status_forcelist=[429, 502, 503, 504],
+    )
+    # One pooled connection per concurrent page fetch, so workers never overflow the pool.
+    adapter = HTTPAdapter(pool_connections=FETCH_WORKERS, pool_maxsize=FETCH_WORKERS, max_retries=retry)
+    session.mount("https://", adapter)
+    return session
+
+
+@functools.lru_cache(maxsize=None)
+def get_session() -> requests.Session:
+    """Shared session, built on first use so importing this module opens no cache file."""
+    return make_session()
+
+
+def fetch_crossref_page(params: dict, headers: dict, rows: int,
+                        offset: Optional[int] = None, cursor: Optional[str] = None,
+                        expire_after: Optional[int] = None) -> dict:
+    """
+    Fetch one page from Crossref by offset or deep-paging cursor.
+    expire_after overrides the cache lifetime of this page (requests-cache only).
+    Cursor pages are never cached: their next-cursor expires on Crossref's side
+    within minutes, so a cached one would break every later rerun.
+    """
     url = "https://api.crossref.org/works"
     q = params.copy()
-    q["rows"]   = rows
-    q["offset"] = offset
-    for attempt in range(1, MAX_RETRIES + 1):
-        resp = requests.get(url, params=q, headers=headers, timeout=HTTP_TIMEOUT)
-        if resp.status_code == 200:
-            return resp.json()
-        if resp.status_code in (429, 502, 503, 504):
-            time.sleep(BACKOFF_SECONDS * attempt)
-            continue
-        resp.raise_for_status()
-    raise RuntimeError(f"Failed to fetch Crossref page after {MAX_RETRIES} attempts.")
+    q["rows"] = rows
+    if cursor is not None:
+        q["cursor"] = cursor
+        if requests_cache is not None:
+            expire_after = requests_cache.DO_NOT_CACHE
+    else:
+        q["offset"] = offset or 0
+    cache_opts = {"expire_after": expire_after} if requests_cache is not None else {}
+    resp = get_session().get(url, params=q, headers=headers, timeout=HTTP_TIMEOUT, **cache_opts)
+    resp.raise_for_status()
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
+
+
+def iter_crossref_pages(params: dict, headers: dict, expire_after: Optional[int] = None) -> Iterator[list]:
+    """
+    Yield Crossref item pages in order.
+    The first (offset) page reports total-results; if every page is reachable
+    by offset the rest are fetched concurrently. Otherwise that page is
+    discarded and the whole pull is paged through one deep-paging cursor query,
+    so records tied on publication date cannot shift between two queries.
+    """
+    payload = fetch_crossref_page(params, headers, ROWS_PER_PAGE, offset=0, expire_after=expire_after)
+    message = payload.get("message", {})
+    items   = message.get("items", [])
+    if not items:
+        return
+
+    total = message.get("total-results", 0)
+    if total <= MAX_OFFSET:
+        yield items
+        offsets = range(ROWS_PER_PAGE, total, ROWS_PER_PAGE)
+        fetch   = functools.partial(fetch_crossref_page, params, headers, ROWS_PER_PAGE, expire_after=expire_after)
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+            for payload in executor.map(fetch, offsets):  # offset fills the next positional arg
+                yield payload.get("message", {}).get("items", [])
+        return
+
+    cursor = "*"
+    while True:
+        payload = fetch_crossref_page(params, headers, ROWS_PER_PAGE, cursor=cursor)
+        message = payload.get("message", {})
+        items   = message.get("items", [])
+        if not items:
+            return
+        yield items
+        next_cursor = message.get("next-cursor")
+        if not next_cursor or next_cursor == cursor:
+            return
+        cursor = next_cursor
 
 
-def get_crossref_records(prev_start: date, prev_end: date) -> list:
+def get_crossref_records(prev_start: date, prev_end: date) -> Iterator[dict]:
     """
-    Pull Nature Communications journal-articles published in the previous month
-    with abstracts present.
+    Stream Nature Communications journal-articles published in the previous month
+    with abstracts present, one record dict at a time as pages arrive.
     """
     params = {
         "filter": (
@@ -231,39 +490,76 @@ def get_crossref_records(prev_start: date, prev_end: date) -> list:
         "order": "asc",
     }
     headers = {"User-Agent": f"NCommsPrevMonth/2.1 (mailto:{CROSSREF_MAILTO})"}
+    # Results for a month that ended more than CACHE_DAYS ago are settled; never expire them.
+    settled = requests_cache is not None and prev_end < date.today() - timedelta(days=CACHE_DAYS)
+    expire_after = requests_cache.NEVER_EXPIRE if settled else None
 
-    records = []
-    offset  = 0
-
-    while True:
-        payload = fetch_crossref_page(params, headers, ROWS_PER_PAGE, offset)
-        items   = payload.get("message", {}).get("items", [])
-        if not items:
-            break
+    # Bind helpers to locals: the per-item loop is the hot path.
+    _clean, _extract_pub, _format_author = clean_abstract, extract_pub_date, format_author
 
+    for items in iter_crossref_pages(params, headers, expire_after):
         for it in items:
-            title     = (it.get("title") or [""])[0]
-            abstract  = clean_abstract(it.get("abstract", ""))
-            doi       = it.get("DOI", "")
-            url       = it.get("URL", "")
-            pub_date  = extract_pub_date(it)
-            authors   = it.get("author") or []
-            last_auth = format_author(authors[-1]) if authors else ""
-
-            records.append(
-                {
-                    "publication_date": pub_date,
-                    "title": title,
-                    "abstract": abstract,
-                    "doi": doi,
-                    "url": url,
-                    "last_author": last_auth,
-                }
-            )
-
-        offset += ROWS_PER_PAGE
-
-    return records
+            get     = it.get
+            titles  = get("title")
+            authors = get("author")
+
+            yield {
+                "publication_date": _extract_pub(it),
+                "title": titles[0] if titles else "",
+                "abstract": _clean(get("abstract", "")),
+                "doi": get("DOI", ""),
+                "url": get("URL", ""),
+                "last_author": _format_author(authors[-1]) if authors else "",
+            }
+# ------------------------------------------------------------------
+
+
+# ---------------------------- CSV output --------------------------
+def _write_csv_rows(records: Iterator[dict], path: str) -> int:
+    """
+    Write records to path in CSV_COLUMNS order and return how many were written.
+    With pyarrow, rows go through its C++ CSV writer in ROWS_PER_PAGE batches;
+    otherwise csv.DictWriter writes row by row. pyarrow always quotes string
+    fields and the header, so the csv fallback uses QUOTE_ALL to write the same bytes.
+    """
+    count = 0
+    if pacsv is not None:
+        schema = pa.schema([(col, pa.string()) for col in CSV_COLUMNS])
+        with pacsv.CSVWriter(path, schema) as writer:
+            for batch in iter(lambda: list(itertools.islice(records, ROWS_PER_PAGE)), []):
+                writer.write_batch(pa.RecordBatch.from_pylist(batch, schema=schema))
+                count += len(batch)
+        return count
+
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS, lineterminator="\n", quoting=csv.QUOTE_ALL)
+        writer.writeheader()
+        for rec in records:
+            writer.writerow(rec)
+            count += 1
+    return count
+
+
+def write_csv(records: Iterator[dict], csv_name: str) -> int:
+    """
+    Stream records into a temp file next to csv_name and move it into place only
+    once the stream is exhausted, so a failed fetch never clobbers an existing CSV.
+    Returns how many records were written.
+    """
+    with tempfile.NamedTemporaryFile(dir=os.path.dirname(os.path.abspath(csv_name)),
+                                     prefix=".ncomms_", suffix=".csv.tmp", delete=False) as tmp:
+        tmp_path = tmp.name
+    try:
+        count = _write_csv_rows(records, tmp_path)
+        # NamedTemporaryFile is created 0600; give the CSV the usual umask-based mode.
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, csv_name)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return count
 # ------------------------------------------------------------------
 
 
@@ -275,20 +571,10 @@ def main():
     # 1) Crossref records for previous month
     records = get_crossref_records(prev_start, prev_end)
 
-    # 2) Build keyword regex patterns
-    patterns = build_keyword_patterns(KEYWORDS, WHOLE_WORDS)
-
-    # 3) Tag abstracts
-    for rec in records:
-        rec["tags"] = "; ".join(tags_from_abstract(rec["abstract"], patterns, KEYWORDS))
-
-    # 4) Export CSV
-    df = pd.DataFrame(records)
-    if "publication_date" in df.columns:
-        df = df.sort_values(by="publication_date", kind="stable")
-
-    df.to_csv(csv_name, index=False)
-    print(f"Saved {len(df)} records to {csv_name}")
+    # 2) Tag abstracts and stream rows to CSV as they arrive
+    #    (Crossref already returns records sorted by publication date)
+    count = write_csv(tag_records(records, tuple(KEYWORDS), WHOLE_WORDS), csv_name)
+    print(f"Saved {count} records to {csv_name}")
 
 
 if __name__ == "__main__":